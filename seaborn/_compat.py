@@ -1,4 +1,5 @@
 from __future__ import annotations
+import math
 from typing import Literal
 
 import numpy as np
@@ -7,6 +8,67 @@ import matplotlib as mpl
 from matplotlib.figure import Figure
 from seaborn.utils import _version_predates
 
+# Library capabilities are fixed for the life of the process, so resolve them
+# once here rather than in each of the helpers below
+_HAS_COLORMAP_REGISTRY = hasattr(mpl, "colormaps")  # mpl 3.5
+_HAS_LAYOUT_ENGINE = hasattr(Figure, "set_layout_engine")  # mpl 3.6
+_MPL_PREDATES_35 = _version_predates(mpl, "3.5")
+_MPL_PREDATES_37 = _version_predates(mpl, "3.7")
+_MPL_PREDATES_310 = _version_predates(mpl, "3.10.0")
+_PD_PREDATES_22 = _version_predates(pd, "2.2.0")
+
+
+class ScaledNorm(mpl.colors.Normalize):
+    """Normalize data in the transformed space of a matplotlib Scale."""
+    # Set for linear scales, where the transform can be skipped entirely
+    _identity = False
+
+    # Transformed (vmin, vmax), memoized against the limits that produced them
+    _t_limits = None
+
+    def _transform_limits(self):
+        limits = self.vmin, self.vmax
+        if self._t_limits is None or self._t_limits[0] != limits:
+            self._t_limits = limits, tuple(self.transform(limits))
+        return self._t_limits[1]
+
+    def __call__(self, value, clip=None):
+        # From github.com/matplotlib/matplotlib/blob/v3.4.2/lib/matplotlib/colors.py
+        # See github.com/matplotlib/matplotlib/tree/v3.4.2/LICENSE
+        value, is_scalar = self.process_value(value)
+        self.autoscale_None(value)
+        if self.vmin > self.vmax:
+            raise ValueError("vmin must be less or equal to vmax")
+        if self.vmin == self.vmax:
+            return np.full_like(value, 0)
+        if clip is None:
+            clip = self.clip
+        if clip:
+            value = np.clip(value, self.vmin, self.vmax)
+        # ***** Seaborn changes start ****
+        if self._identity:
+            t_value = value
+            t_vmin, t_vmax = self.vmin, self.vmax
+        else:
+            t_value = self.transform(value).reshape(np.shape(value))
+            t_vmin, t_vmax = self._transform_limits()
+        # ***** Seaborn changes end *****
+        if not (math.isfinite(t_vmin) and math.isfinite(t_vmax)):
+            raise ValueError("Invalid vmin or vmax")
+        t_value -= t_vmin
+        t_value /= (t_vmax - t_vmin)
+        # Build the invalid mask in a single reused buffer, rather than
+        # letting masked_invalid allocate one array for the test and another
+        # for its negation, and only pay for a MaskedArray when something
+        # actually needs to be masked
+        invalid = np.isfinite(np.ma.getdata(t_value))
+        np.logical_not(invalid, out=invalid)
+        if invalid.any() or np.ma.is_masked(t_value):
+            t_value = np.ma.masked_where(invalid, t_value, copy=False)
+        else:
+            t_value = np.ma.getdata(t_value)
+        return t_value[0] if is_scalar else t_value
+
 
 def norm_from_scale(scale, norm):
     """Produce a Normalize object given a Scale and min/max domain limits."""
@@ -24,44 +86,19 @@ def norm_from_scale(scale, norm):
     else:
         vmin, vmax = norm  # TODO more helpful error if this fails?
 
-    class ScaledNorm(mpl.colors.Normalize):
-
-        def __call__(self, value, clip=None):
-            # From github.com/matplotlib/matplotlib/blob/v3.4.2/lib/matplotlib/colors.py
-            # See github.com/matplotlib/matplotlib/tree/v3.4.2/LICENSE
-            value, is_scalar = self.process_value(value)
-            self.autoscale_None(value)
-            if self.vmin > self.vmax:
-                raise ValueError("vmin must be less or equal to vmax")
-            if self.vmin == self.vmax:
-                return np.full_like(value, 0)
-            if clip is None:
-                clip = self.clip
-            if clip:
-                value = np.clip(value, self.vmin, self.vmax)
-            # ***** Seaborn changes start ****
-            t_value = self.transform(value).reshape(np.shape(value))
-            t_vmin, t_vmax = self.transform([self.vmin, self.vmax])
-            # ***** Seaborn changes end *****
-            if not np.isfinite([t_vmin, t_vmax]).all():
-                raise ValueError("Invalid vmin or vmax")
-            t_value -= t_vmin
-            t_value /= (t_vmax - t_vmin)
-            t_value = np.ma.masked_invalid(t_value, copy=False)
-            return t_value[0] if is_scalar else t_value
-
+    transform = scale.get_transform()
     new_norm = ScaledNorm(vmin, vmax)
-    new_norm.transform = scale.get_transform().transform
+    new_norm.transform = transform.transform
+    new_norm._identity = isinstance(transform, mpl.transforms.IdentityTransform)
 
     return new_norm
 
 
 def get_colormap(name):
     """Handle changes to matplotlib colormap interface in 3.6."""
-    try:
+    if _HAS_COLORMAP_REGISTRY:
         return mpl.colormaps[name]
-    except AttributeError:
-        return mpl.cm.get_cmap(name)
+    return mpl.cm.get_cmap(name)
 
 
 def register_colormap(name, cmap):
@@ -78,7 +115,7 @@ def set_layout_engine(
     engine: Literal["constrained", "compressed", "tight", "none"],
 ) -> None:
     """Handle changes to auto layout engine interface in 3.6"""
-    if hasattr(fig, "set_layout_engine"):
+    if _HAS_LAYOUT_ENGINE:
         fig.set_layout_engine(engine)
     else:
         # _version_predates(mpl, 3.6)
@@ -93,37 +130,45 @@ def set_layout_engine(
 
 def get_layout_engine(fig: Figure) -> mpl.layout_engine.LayoutEngine | None:
     """Handle changes to auto layout engine interface in 3.6"""
-    if hasattr(fig, "get_layout_engine"):
+    if _HAS_LAYOUT_ENGINE:
         return fig.get_layout_engine()
     else:
         # _version_predates(mpl, 3.6)
         return None
 
 
+if _MPL_PREDATES_35:
+    _SHARE_AXIS = {
+        "x": lambda ax0, ax1: ax0.get_shared_x_axes().join(ax1, ax0),
+        "y": lambda ax0, ax1: ax0.get_shared_y_axes().join(ax1, ax0),
+    }
+else:
+    _SHARE_AXIS = {
+        "x": lambda ax0, ax1: ax1.sharex(ax0),
+        "y": lambda ax0, ax1: ax1.sharey(ax0),
+    }
+
+
 def share_axis(ax0, ax1, which):
     """Handle changes to post-hoc axis sharing."""
-    if _version_predates(mpl, "3.5"):
-        group = getattr(ax0, f"get_shared_{which}_axes")()
-        group.join(ax1, ax0)
-    else:
-        getattr(ax1, f"share{which}")(ax0)
+    _SHARE_AXIS[which](ax0, ax1)
 
 
 def get_legend_handles(legend):
     """Handle legendHandles attribute rename."""
-    if _version_predates(mpl, "3.7"):
+    if _MPL_PREDATES_37:
         return legend.legendHandles
     else:
         return legend.legend_handles
 
 
 def groupby_apply_include_groups(val):
-    if _version_predates(pd, "2.2.0"):
+    if _PD_PREDATES_22:
         return {}
     return {"include_groups": val}
 
 
 def get_converter(axis):
-    if _version_predates(mpl, "3.10.0"):
+    if _MPL_PREDATES_310:
         return axis.converter
     return axis.get_converter()
@@ -0,0 +1,82 @@
+import numpy as np
+import matplotlib as mpl
+
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from seaborn._compat import norm_from_scale
+
+
+class TestNormFromScale:
+
+    def test_passthrough(self):
+
+        norm = mpl.colors.Normalize(0, 1)
+        assert norm_from_scale(mpl.scale.LinearScale(None), norm) is norm
+        assert norm_from_scale(None, (0, 1)) is None
+
+    def test_linear(self):
+
+        norm = norm_from_scale(mpl.scale.LinearScale(None), (2, 6))
+        x = np.array([2, 3, 4, 6])
+        assert_array_almost_equal(norm(x), [0, .25, .5, 1])
+
+    def test_linear_invalid_values_masked(self):
+
+        norm = norm_from_scale(mpl.scale.LinearScale(None), (0, 10))
+        res = norm(np.array([5, np.inf, np.nan]))
+        assert res[0] == pytest.approx(.5)
+        assert res.mask.tolist() == [False, True, True]
+
+    def test_log(self):
+
+        norm = norm_from_scale(mpl.scale.LogScale(None), (1, 100))
+        x = np.array([1, 10, 100])
+        assert_array_almost_equal(norm(x), [0, .5, 1])
+
+    def test_autoscale(self):
+
+        norm = norm_from_scale(mpl.scale.LogScale(None), None)
+        x = np.array([10, 100, 1000])
+        assert_array_almost_equal(norm(x), [0, .5, 1])
+        assert norm.vmin == 10
+        assert norm.vmax == 1000
+
+    def test_scalar(self):
+
+        norm = norm_from_scale(mpl.scale.LogScale(None), (1, 100))
+        assert norm(10) == pytest.approx(.5)
+
+    def test_invalid_values_masked(self):
+
+        norm = norm_from_scale(mpl.scale.LogScale(None), (1, 100))
+        res = norm(np.array([10, -1]))
+        assert np.ma.is_masked(res)
+        assert res.mask.tolist() == [False, True]
+
+    def test_valid_values_unmasked(self):
+
+        norm = norm_from_scale(mpl.scale.LogScale(None), (1, 100))
+        res = norm(np.array([1, 10, 100]))
+        assert not isinstance(res, np.ma.MaskedArray)
+
+    def test_input_mask_preserved(self):
+
+        norm = norm_from_scale(mpl.scale.LogScale(None), (1, 100))
+        res = norm(np.ma.masked_array([1, 10, 100], mask=[False, True, False]))
+        assert res.mask.tolist() == [False, True, False]
+
+    def test_invalid_limits(self):
+
+        scale = mpl.scale.LogScale(None, nonpositive="mask")
+        norm = norm_from_scale(scale, (0, 100))
+        with pytest.raises(ValueError, match="Invalid vmin or vmax"):
+            norm(np.array([1, 10]))
+
+    def test_limits_updated(self):
+
+        norm = norm_from_scale(mpl.scale.LogScale(None), (1, 100))
+        x = np.array([1, 10, 100])
+        assert_array_almost_equal(norm(x), [0, .5, 1])
+        norm.vmax = 10
+        assert_array_almost_equal(norm(x), [0, 1, 2])